@@ -7,10 +7,11 @@ from io import StringIO
 from config import COLORS
 from utils.data_fetcher import (
     descargar_datos,
+    descargar_datos_multitemporal,
     get_all_index_tickers,
     get_all_stock_tickers
 )
-from utils.technical_analysis import analizar_tecnico
+from utils.technical_analysis import analizar_tecnico, analizar_tecnico_multitemporal
 from utils.fundamental_analysis import analizar_fundamental
 from utils.sentiment_analysis import analizar_sentimiento_noticias
 from utils.charts import generar_grafico_precio
@@ -55,6 +56,8 @@ elif tipo_activo == "Acción":
     acciones = get_all_stock_tickers()
     ticker = st.sidebar.selectbox("Selecciona una acción", list(acciones.keys()), format_func=lambda x: f"{x} - {acciones[x]}")
 
+multitemporal = st.sidebar.toggle("Análisis técnico multitemporal (1h / 1d / 1wk)", value=False)
+
 def resumen_final(score_t, score_f, score_s):
     media = int((score_t + score_f + score_s) / 3)
     if media >= 75:
@@ -74,7 +77,11 @@ def color_por_score(score):
         return "#FFB3B3"
 
 if ticker:
-    df = descargar_datos(ticker)
+    if multitemporal:
+        datos_mt = descargar_datos_multitemporal(ticker)
+        df = datos_mt.get("1d", pd.DataFrame())
+    else:
+        df = descargar_datos(ticker)
     if not df.empty:
         es_indice = ticker.startswith("^")
 
@@ -82,7 +89,18 @@ if ticker:
         with col_main:
             st.subheader("📈 Resultados")
 
-            score_t, razones_t, df, detalles_t, tendencias_t = analizar_tecnico(df)
+            if multitemporal:
+                score_t, resultados_mt = analizar_tecnico_multitemporal(datos_mt)
+                _, razones_t, df, detalles_t, tendencias_t = resultados_mt["1d"]
+                razones_t = [
+                    f"⏱️ Temporalidad {intervalo}: {res[0]}/100" if res[3]
+                    else f"⏱️ Temporalidad {intervalo}: sin datos suficientes (excluida del score)"
+                    for intervalo, res in resultados_mt.items()
+                ] + razones_t
+                detalles_t = ["Score técnico de la temporalidad."] * len(resultados_mt) + detalles_t
+                tendencias_t = ["⏱️"] * len(resultados_mt) + tendencias_t
+            else:
+                score_t, razones_t, df, detalles_t, tendencias_t = analizar_tecnico(df)
             if not es_indice:
                 score_f, razones_f = analizar_fundamental(ticker)
             else:
@@ -131,7 +149,7 @@ if ticker:
             st.subheader("📅 Análisis Automático")
 
             if st.button("Ejecutar análisis y guardar histórico"):
-                resultado = ejecutar_analisis_programado(ticker)
+                resultado = ejecutar_analisis_programado(ticker, multitemporal=multitemporal)
                 if resultado:
                     st.success(f"Análisis ejecutado para {ticker} y guardado.")
                 else:
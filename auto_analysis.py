@@ -2,8 +2,8 @@ import os
 import datetime
 import pandas as pd
 
-from utils.data_fetcher import descargar_datos
-from utils.technical_analysis import analizar_tecnico
+from utils.data_fetcher import descargar_datos, descargar_datos_multitemporal
+from utils.technical_analysis import analizar_tecnico, analizar_tecnico_multitemporal
 from utils.fundamental_analysis import analizar_fundamental
 from utils.sentiment_analysis import analizar_sentimiento_noticias
 
@@ -15,9 +15,13 @@ def clasificar_recomendacion(score):
     else:
         return "Baja"
 
-def ejecutar_analisis_programado(ticker="AAPL"):
+def ejecutar_analisis_programado(ticker="AAPL", multitemporal=False):
     fecha_actual = datetime.date.today().strftime("%Y-%m-%d")
-    df = descargar_datos(ticker)
+    if multitemporal:
+        datos = descargar_datos_multitemporal(ticker)
+        df = datos.get("1d", pd.DataFrame())
+    else:
+        df = descargar_datos(ticker)
     if df.empty:
         print(f"{fecha_actual} - No se pudieron obtener datos para {ticker}")
         return None
@@ -25,7 +29,10 @@ def ejecutar_analisis_programado(ticker="AAPL"):
     cierre = df["Close"].iloc[-1]
 
     # Análisis técnico
-    score_t, _, df, _, _ = analizar_tecnico(df)
+    if multitemporal:
+        score_t, _ = analizar_tecnico_multitemporal(datos)
+    else:
+        score_t, _, df, _, _ = analizar_tecnico(df)
 
     # Análisis fundamental (omitido si es índice)
     if ticker.startswith("^"):
@@ -48,7 +55,8 @@ def ejecutar_analisis_programado(ticker="AAPL"):
         "score_fundamental": score_f,
         "score_sentimiento": score_s,
         "score_final": score_final,
-        "recomendacion": recomendacion
+        "recomendacion": recomendacion,
+        "modo_tecnico": "multitemporal" if multitemporal else "diario"
     }
 
     output_file = f"historico_{ticker.replace('^', '')}.csv"
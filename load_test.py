@@ -0,0 +1,591 @@
+"""
+Prueba de carga y soak del dashboard de Streamlit.
+
+Arranca app.py en local (a través de load_test_app.py) con proveedores falsos de datos,
+scraping y LLM, abre N sesiones concurrentes por websocket y mide:
+  - latencia de página (p50/p95/p99): desde la petición de rerun hasta script_finished más la
+    descarga de las imágenes (/media) de st.pyplot; no incluye el renderizado del navegador
+  - CPU y RSS del servidor a lo largo del tiempo (Linux, vía /proc)
+  - número de llamadas que llegan a cada proveedor externo
+
+Cada sesión hace primero dos reruns de descubrimiento (página por defecto y cambio a "Acción")
+para conocer los widgets; no se miden ni cuentan como páginas y sus llamadas upstream se
+informan aparte. Después analiza su ticker, tomado de las opciones que renderiza el servidor
+(o de --tickers), así que se ejercitan yfinance, Finviz, noticias y OpenAI; una fracción de
+sesiones activa además el modo multitemporal.
+Las páginas que terminan con una excepción de la app cuentan como errores, no como latencias.
+
+nltk.download se sustituye por un contador: el léxico vader_lexicon debe estar ya instalado
+para que el análisis de sentimiento funcione durante la prueba.
+
+Ejemplos:
+    python load_test.py --sesiones 20 --iteraciones 5
+    python load_test.py --sesiones 50 --duracion 600 --latencia 0.2 --salida informe.json
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from collections import Counter
+from types import SimpleNamespace
+
+# ---------------------------------------------------------------------------
+# Proveedores falsos (se instalan dentro del proceso del servidor)
+# ---------------------------------------------------------------------------
+
+_fd_contadores = None
+_fakes_instalados = False
+
+BARRAS_POR_PERIODO = {"1mo": 21, "3mo": 63, "6mo": 126, "1y": 252, "2y": 504, "5y": 1260}
+
+# Zona horaria, hora y minuto de apertura y número de velas horarias por sufijo de Yahoo
+MERCADOS = {
+    "": ("America/New_York", 9, 30, 7),
+    ".MC": ("Europe/Madrid", 9, 0, 9),
+    ".DE": ("Europe/Berlin", 9, 0, 9),
+    ".PA": ("Europe/Paris", 9, 0, 9),
+    ".MI": ("Europe/Rome", 9, 0, 9)
+}
+
+METRICAS_FINVIZ_FALSAS = {
+    "Sales growth": "12.50%",
+    "Gross Margin": "45.10%",
+    "Operating Margin": "22.30%",
+    "ROA": "11.20%",
+    "ROE": "25.40%",
+    "ROI": "18.90%",
+    "EPS growth this year": "9.80%",
+    "Debt/Eq": "0.85",
+    "Current Ratio": "1.40"
+}
+
+TITULARES_FALSOS = [
+    "{ticker} beats earnings expectations",
+    "{ticker} shares slip after guidance update",
+    "Analysts raise price target on {ticker}",
+    "{ticker} announces new product line",
+    "Market volatility weighs on {ticker}"
+]
+
+
+def _registrar_llamada(proveedor):
+    # Una línea por llamada en un fichero O_APPEND: sin lock ni reescrituras en el servidor medido
+    if _fd_contadores is not None:
+        os.write(_fd_contadores, f"{proveedor}\n".encode())
+    latencia = float(os.environ.get("LOAD_TEST_LATENCIA", "0"))
+    if latencia > 0:
+        time.sleep(latencia)
+
+
+def _generar_ohlcv(ticker, periodo="1y", intervalo="1d", auto_adjust=True):
+    """
+    Serie OHLCV sintética y determinista por ticker, con el formato de yf.download:
+    columnas MultiIndex (Price, Ticker) e índice en la zona horaria del mercado para 1h.
+    """
+    import numpy as np
+    import pandas as pd
+
+    sufijo = "." + ticker.rsplit(".", 1)[1] if "." in ticker else ""
+    zona, hora, minuto, velas = MERCADOS.get(sufijo, MERCADOS[""])
+    dias = BARRAS_POR_PERIODO.get(periodo, 252)
+    fechas = pd.bdate_range(end=pd.Timestamp.today().normalize(), periods=dias)
+    if intervalo == "1h":
+        indice = pd.DatetimeIndex([
+            f + pd.Timedelta(hours=hora + h, minutes=minuto) for f in fechas for h in range(velas)
+        ]).tz_localize(zona)
+        indice.name = "Datetime"
+    elif intervalo == "1wk":
+        indice = pd.date_range(end=fechas[-1], periods=max(dias // 5, 1), freq="W-MON", name="Date")
+    else:
+        indice = fechas.rename("Date")
+
+    rng = np.random.default_rng(sum(ord(c) for c in ticker))
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, len(indice))))
+    open_ = close * (1 + rng.normal(0, 0.003, len(indice)))
+    high = np.maximum(open_, close) * (1 + rng.uniform(0, 0.01, len(indice)))
+    low = np.minimum(open_, close) * (1 - rng.uniform(0, 0.01, len(indice)))
+    volume = rng.integers(1_000_000, 5_000_000, len(indice))
+
+    columnas = {"Close": close, "High": high, "Low": low, "Open": open_, "Volume": volume}
+    if not auto_adjust:
+        columnas = {"Adj Close": close, **columnas}
+    df = pd.DataFrame(columnas, index=indice)
+    df.columns = pd.MultiIndex.from_product([df.columns, [ticker]], names=["Price", "Ticker"])
+    return df
+
+
+def _yf_download_falso(ticker, period="1y", interval="1d", auto_adjust=True, **kwargs):
+    _registrar_llamada("yfinance")
+    return _generar_ohlcv(ticker, period, interval, auto_adjust)
+
+
+def _requests_get_falso(url, *args, **kwargs):
+    _registrar_llamada("finviz")
+    celdas = "".join(f"<td>{k}</td><td>{v}</td>" for k, v in METRICAS_FINVIZ_FALSAS.items())
+    html = f'<html><body><table class="snapshot-table2"><tr>{celdas}</tr></table></body></html>'
+    return SimpleNamespace(status_code=200, text=html, raise_for_status=lambda: None)
+
+
+def _feedparser_parse_falso(url, *args, **kwargs):
+    _registrar_llamada("noticias")
+    ticker = url.split("q=")[-1].split("+")[0]
+    return SimpleNamespace(entries=[SimpleNamespace(title=t.format(ticker=ticker)) for t in TITULARES_FALSOS])
+
+
+def _nltk_download_falso(*args, **kwargs):
+    _registrar_llamada("nltk")
+    return True
+
+
+class _OpenAIFalso:
+    def __init__(self, *args, **kwargs):
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    def _create(self, *args, **kwargs):
+        _registrar_llamada("openai")
+        texto = "Análisis simulado para prueba de carga. " * 20
+        return [
+            SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=palabra + " "))])
+            for palabra in texto.split()
+        ]
+
+
+def instalar_fakes():
+    """
+    Sustituye yfinance, requests (Finviz), feedparser, nltk.download y OpenAI por versiones falsas.
+    Es idempotente: Streamlit re-ejecuta el script en cada rerun, pero los módulos se mantienen.
+    """
+    global _fakes_instalados, _fd_contadores
+    if _fakes_instalados:
+        return
+
+    import feedparser
+    import nltk
+    import openai
+    import requests
+    import streamlit as st
+    import yfinance as yf
+
+    ruta = os.environ.get("LOAD_TEST_CONTADORES")
+    if ruta:
+        _fd_contadores = os.open(ruta, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+
+    yf.download = _yf_download_falso
+    requests.get = _requests_get_falso
+    feedparser.parse = _feedparser_parse_falso
+    nltk.download = _nltk_download_falso
+    openai.OpenAI = _OpenAIFalso
+    st.secrets = {"openai_api_key": "load-test"}
+    _fakes_instalados = True
+
+
+# ---------------------------------------------------------------------------
+# Cliente de carga
+# ---------------------------------------------------------------------------
+
+def _percentil(valores, p):
+    if not valores:
+        return None
+    ordenados = sorted(valores)
+    k = max(0, math.ceil(p / 100 * len(ordenados)) - 1)
+    return ordenados[k]
+
+
+def _leer_contadores(ruta):
+    """
+    Cuenta las llamadas por proveedor del fichero append-only; ignora una última línea incompleta.
+    """
+    if not os.path.exists(ruta):
+        return Counter()
+    with open(ruta, encoding="utf-8", errors="replace") as f:
+        lineas = f.read().split("\n")
+    return Counter(linea for linea in lineas[:-1] if linea)
+
+
+def _leer_proc(pid):
+    """
+    Devuelve (segundos de CPU acumulados, RSS en MB) del proceso, o None si /proc no está disponible.
+    """
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            campos = f.read().rsplit(")", 1)[1].split()
+        cpu = (int(campos[11]) + int(campos[12])) / os.sysconf("SC_CLK_TCK")
+        with open(f"/proc/{pid}/status") as f:
+            rss_kb = next(int(l.split()[1]) for l in f if l.startswith("VmRSS:"))
+        return cpu, rss_kb / 1024
+    except (OSError, StopIteration, IndexError, ValueError):
+        return None
+
+
+def muestrear_servidor(pid, intervalo, parar, muestras):
+    inicio = time.time()
+    previo = _leer_proc(pid)
+    t_previo = inicio
+    while not parar.wait(intervalo):
+        actual = _leer_proc(pid)
+        ahora = time.time()
+        if actual is None or previo is None:
+            break
+        cpu_pct = 100 * (actual[0] - previo[0]) / (ahora - t_previo)
+        muestras.append({"t": round(ahora - inicio, 2), "cpu_pct": round(cpu_pct, 1), "rss_mb": round(actual[1], 1)})
+        previo, t_previo = actual, ahora
+
+
+ETIQUETA_TIPO_ACTIVO = "Tipo de activo"
+ETIQUETA_ACCION = "Selecciona una acción"
+ETIQUETA_MULTITEMPORAL = "Análisis técnico multitemporal"
+
+
+def _widget_state(widget_id, elemento, valor):
+    """
+    Construye el WidgetState de un selectbox (índice de opción) o toggle (bool).
+    Las versiones recientes de Streamlit serializan el selectbox como texto de la opción
+    (su proto incluye `raw_value`); las anteriores, como índice entero.
+    """
+    from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+    estado = WidgetState(id=widget_id)
+    if isinstance(valor, bool):
+        estado.bool_value = valor
+    elif "raw_value" in elemento.DESCRIPTOR.fields_by_name:
+        estado.string_value = elemento.options[valor]
+    else:
+        estado.int_value = valor
+    return estado
+
+
+async def _ejecutar_pagina(conexion, widgets_enviados, timeout, url_http=None):
+    """
+    Pide un rerun con el estado de widgets indicado, espera a script_finished y, si se indica
+    `url_http`, descarga las imágenes (/media) de la página como haría el navegador.
+    Devuelve (widgets vistos {etiqueta: elemento}, lista de errores de la página).
+    """
+    from streamlit.proto.BackMsg_pb2 import BackMsg
+    from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+    from tornado.httpclient import AsyncHTTPClient
+
+    peticion = BackMsg()
+    peticion.rerun_script.SetInParent()
+    peticion.rerun_script.widget_states.widgets.extend(widgets_enviados)
+    await conexion.write_message(peticion.SerializeToString(), binary=True)
+
+    finalizados_ok = {ForwardMsg.FINISHED_SUCCESSFULLY, getattr(ForwardMsg, "FINISHED_FRAGMENT_RUN_SUCCESSFULLY", 0)}
+    widgets, errores_pagina, imagenes = {}, [], []
+
+    async def esperar_fin():
+        while True:
+            datos = await conexion.read_message()
+            if datos is None:
+                raise ConnectionError("El servidor cerró el websocket")
+            respuesta = ForwardMsg()
+            respuesta.ParseFromString(datos)
+            tipo = respuesta.WhichOneof("type")
+            if tipo == "delta" and respuesta.delta.WhichOneof("type") == "new_element":
+                elemento = respuesta.delta.new_element
+                tipo_elemento = elemento.WhichOneof("type")
+                if tipo_elemento in ("selectbox", "checkbox"):
+                    widget = getattr(elemento, tipo_elemento)
+                    widgets[widget.label] = widget
+                elif tipo_elemento == "imgs":
+                    imagenes.extend(img.url for img in elemento.imgs.imgs)
+                elif tipo_elemento == "exception":
+                    errores_pagina.append(f"Excepción en la app: {elemento.exception.type}: {elemento.exception.message}")
+            elif tipo == "script_finished":
+                if respuesta.script_finished not in finalizados_ok:
+                    errores_pagina.append(f"Script terminado con estado {respuesta.script_finished}")
+                break
+
+        if url_http:
+            cliente = AsyncHTTPClient()
+            for url in imagenes:
+                try:
+                    await cliente.fetch(url_http + url if url.startswith("/") else url)
+                except Exception as e:
+                    errores_pagina.append(f"Imagen no descargada ({url}): {e}")
+
+    await asyncio.wait_for(esperar_fin(), timeout)
+    return widgets, errores_pagina
+
+
+async def preparar_sesion(sesion, url, tickers, timeout, errores):
+    """
+    Reruns de descubrimiento (no medidos): carga la página por defecto, elige "Acción" y el
+    modo multitemporal, y selecciona el ticker de la sesión entre las opciones del servidor.
+    Deja en `sesion` la conexión abierta y el estado de widgets para la fase medida.
+    """
+    from tornado.websocket import websocket_connect
+
+    try:
+        sesion["conexion"] = await websocket_connect(url, subprotocols=["streamlit"])
+        widgets, _ = await _ejecutar_pagina(sesion["conexion"], [], timeout)
+        tipo = widgets.get(ETIQUETA_TIPO_ACTIVO)
+        toggle = next((w for etiqueta, w in widgets.items() if etiqueta.startswith(ETIQUETA_MULTITEMPORAL)), None)
+        if tipo is None or toggle is None:
+            errores.append(f"Sesión {sesion['indice']}: no se encontraron los widgets de tipo de activo o multitemporal")
+            return
+
+        estado = [
+            _widget_state(tipo.id, tipo, list(tipo.options).index("Acción")),
+            _widget_state(toggle.id, toggle, sesion["multitemporal"])
+        ]
+        widgets, _ = await _ejecutar_pagina(sesion["conexion"], estado, timeout)
+        accion = widgets.get(ETIQUETA_ACCION)
+        if accion is None:
+            errores.append(f"Sesión {sesion['indice']}: no se encontró el selectbox de acciones")
+            return
+    except Exception as e:
+        errores.append(f"Sesión {sesion['indice']}: descubrimiento fallido: {e!r}")
+        return
+
+    opciones = list(accion.options)
+    if tickers:
+        ticker = tickers[sesion["indice"] % len(tickers)]
+        posicion = next((i for i, opcion in enumerate(opciones) if opcion.startswith(f"{ticker} - ")), None)
+        if posicion is None:
+            errores.append(f"Sesión {sesion['indice']}: {ticker} no está entre las opciones de la app")
+            return
+    else:
+        posicion = sesion["indice"] % len(opciones)
+        ticker = opciones[posicion].split(" - ")[0]
+
+    sesion["ticker"] = ticker
+    sesion["estado"] = estado + [_widget_state(accion.id, accion, posicion)]
+    sesion["preparada"] = True
+
+
+async def ejecutar_sesion(sesion, url, url_http, iteraciones, fin, espera, timeout, latencias, errores, estadisticas):
+    """
+    Fase medida de una sesión preparada: reruns con su estado de widgets hasta agotar iteraciones
+    o llegar al instante `fin`. Si la conexión o una página fallan, reconecta y continúa.
+    """
+    from tornado.websocket import websocket_connect
+
+    conexion, ticker = sesion["conexion"], sesion["ticker"]
+    hechas = 0
+    try:
+        while (fin is None and hechas < iteraciones) or (fin is not None and time.time() < fin):
+            if conexion is None:
+                try:
+                    conexion = await websocket_connect(url, subprotocols=["streamlit"])
+                except Exception as e:
+                    errores.append(f"Conexión fallida: {e}")
+                    estadisticas["reconexiones"] += 1
+                    hechas += 1
+                    await asyncio.sleep(1)
+                    continue
+
+            inicio = time.perf_counter()
+            try:
+                _, errores_pagina = await _ejecutar_pagina(conexion, sesion["estado"], timeout, url_http)
+            except Exception as e:
+                errores.append(f"Página fallida ({ticker}): {e!r}")
+                conexion.close()
+                conexion = None
+                estadisticas["reconexiones"] += 1
+                hechas += 1
+                continue
+
+            hechas += 1
+            if errores_pagina:
+                errores.extend(f"{ticker}: {error}" for error in errores_pagina)
+            else:
+                latencias.append(time.perf_counter() - inicio)
+            if espera:
+                await asyncio.sleep(espera)
+    finally:
+        if conexion is not None:
+            conexion.close()
+            estadisticas["activas_al_final"] += 1
+
+
+def esperar_servidor(puerto, servidor, timeout=60):
+    limite = time.time() + timeout
+    while time.time() < limite:
+        if servidor.poll() is not None:
+            return False
+        try:
+            with urllib.request.urlopen(f"http://localhost:{puerto}/_stcore/health", timeout=2) as r:
+                if r.status == 200:
+                    return True
+        except OSError:
+            pass
+        time.sleep(0.5)
+    return False
+
+
+def ejecutar_prueba_carga(sesiones=10, iteraciones=3, duracion=None, puerto=8599, latencia=0.0,
+                          espera=0.0, timeout=120, intervalo_muestreo=1.0, fraccion_multitemporal=0.25,
+                          tickers=None):
+    """
+    Arranca el servidor con proveedores falsos, prepara las sesiones (descubrimiento no medido),
+    lanza la fase medida concurrente y devuelve el informe. Sin `tickers`, las acciones que
+    ofrece la app se reparten entre sesiones; una fracción activa el modo multitemporal.
+    """
+    directorio = os.path.dirname(os.path.abspath(__file__))
+    directorio_temporal = tempfile.mkdtemp(prefix="load_test_")
+    fichero_contadores = os.path.join(directorio_temporal, "contadores.log")
+    fichero_log = os.path.join(directorio_temporal, "servidor.log")
+    entorno = dict(os.environ, LOAD_TEST_CONTADORES=fichero_contadores, LOAD_TEST_LATENCIA=str(latencia))
+
+    log = open(fichero_log, "w", encoding="utf-8")
+    servidor = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", os.path.join(directorio, "load_test_app.py"),
+         "--server.port", str(puerto),
+         "--server.headless", "true",
+         "--server.enableXsrfProtection", "false",
+         "--server.fileWatcherType", "none",
+         "--browser.gatherUsageStats", "false"],
+        cwd=directorio, env=entorno, stdout=log, stderr=subprocess.STDOUT
+    )
+
+    n_multitemporal = round(fraccion_multitemporal * sesiones)
+    lista_sesiones = [
+        {"indice": i, "multitemporal": i < n_multitemporal, "ticker": None,
+         "estado": [], "conexion": None, "preparada": False}
+        for i in range(sesiones)
+    ]
+    latencias, errores, muestras = [], [], []
+    estadisticas = {"reconexiones": 0, "activas_al_final": 0}
+    llamadas_descubrimiento = Counter()
+    parar = threading.Event()
+    try:
+        if not esperar_servidor(puerto, servidor):
+            estado = "terminó" if servidor.poll() is not None else "no respondió"
+            raise RuntimeError(f"El servidor de Streamlit {estado} en el puerto {puerto}; revisa el log: {fichero_log}")
+
+        url = f"ws://localhost:{puerto}/_stcore/stream"
+        url_http = f"http://localhost:{puerto}"
+
+        async def lanzar():
+            # Un único bucle de eventos: las conexiones de la fase de descubrimiento se reutilizan
+            nonlocal llamadas_descubrimiento
+            await asyncio.gather(*[preparar_sesion(s, url, tickers, timeout, errores) for s in lista_sesiones])
+            for sesion in lista_sesiones:
+                if not sesion["preparada"] and sesion["conexion"] is not None:
+                    sesion["conexion"].close()
+            preparadas = [s for s in lista_sesiones if s["preparada"]]
+            llamadas_descubrimiento = _leer_contadores(fichero_contadores)
+
+            threading.Thread(
+                target=muestrear_servidor, args=(servidor.pid, intervalo_muestreo, parar, muestras), daemon=True
+            ).start()
+
+            fin = time.time() + duracion if duracion else None
+            inicio = time.time()
+            await asyncio.gather(*[
+                ejecutar_sesion(s, url, url_http, iteraciones, fin, espera, timeout, latencias, errores, estadisticas)
+                for s in preparadas
+            ])
+            return preparadas, time.time() - inicio
+
+        preparadas, total = asyncio.run(lanzar())
+    finally:
+        parar.set()
+        servidor.terminate()
+        try:
+            servidor.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            servidor.kill()
+        log.close()
+
+    llamadas = _leer_contadores(fichero_contadores) - llamadas_descubrimiento
+
+    return {
+        "sesiones": sesiones,
+        "sesiones_medidas": len(preparadas),
+        "sesiones_multitemporal": sum(1 for s in preparadas if s["multitemporal"]),
+        "sesiones_activas_al_final": estadisticas["activas_al_final"],
+        "reconexiones": estadisticas["reconexiones"],
+        "tickers": sorted({s["ticker"] for s in preparadas}),
+        "log_servidor": fichero_log,
+        "duracion_s": round(total, 2),
+        "paginas": len(latencias),
+        "errores": len(errores),
+        "detalle_errores": errores[:20],
+        "latencia_s": {
+            "medida": "script_finished + descarga de imágenes /media (sin renderizado del navegador)",
+            "p50": _percentil(latencias, 50),
+            "p95": _percentil(latencias, 95),
+            "p99": _percentil(latencias, 99),
+            "max": max(latencias) if latencias else None
+        },
+        "servidor": {
+            "cpu_pct_medio": round(sum(m["cpu_pct"] for m in muestras) / len(muestras), 1) if muestras else None,
+            "rss_mb_max": max(m["rss_mb"] for m in muestras) if muestras else None,
+            "muestras": muestras
+        },
+        "llamadas_upstream": dict(llamadas),
+        "llamadas_upstream_descubrimiento": dict(llamadas_descubrimiento)
+    }
+
+
+def imprimir_informe(informe):
+    lat = informe["latencia_s"]
+    fmt = lambda v: f"{v:.3f}s" if v is not None else "N/D"
+    print(f"Sesiones: {informe['sesiones_medidas']}/{informe['sesiones']} medidas "
+          f"({informe['sesiones_multitemporal']} multitemporal, "
+          f"{informe['sesiones_activas_al_final']} activas al final, {informe['reconexiones']} reconexiones)")
+    print(f"Tickers: {', '.join(informe['tickers']) or 'ninguno'}")
+    print(f"Páginas: {informe['paginas']}  Errores: {informe['errores']}  Duración: {informe['duracion_s']}s")
+    print(f"Latencia ({lat['medida']}) p50: {fmt(lat['p50'])}  p95: {fmt(lat['p95'])}  "
+          f"p99: {fmt(lat['p99'])}  max: {fmt(lat['max'])}")
+    srv = informe["servidor"]
+    print(f"Servidor CPU medio: {srv['cpu_pct_medio'] if srv['cpu_pct_medio'] is not None else 'N/D'}%  "
+          f"RSS máx: {srv['rss_mb_max'] if srv['rss_mb_max'] is not None else 'N/D'} MB")
+    print("Llamadas a proveedores externos (fase medida):")
+    for proveedor, n in sorted(informe["llamadas_upstream"].items()):
+        paginas = informe["paginas"] or 1
+        print(f"  - {proveedor}: {n} ({n / paginas:.2f} por página)")
+    print("Llamadas durante el descubrimiento (no medido):")
+    for proveedor, n in sorted(informe["llamadas_upstream_descubrimiento"].items()):
+        print(f"  - {proveedor}: {n}")
+    for error in informe["detalle_errores"]:
+        print(f"❌ {error}")
+    print(f"Log del servidor: {informe['log_servidor']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Prueba de carga del dashboard con sesiones concurrentes.")
+    parser.add_argument("--sesiones", type=int, default=10, help="Sesiones concurrentes simuladas")
+    parser.add_argument("--iteraciones", type=int, default=3, help="Reruns medidos por sesión (ignorado con --duracion)")
+    parser.add_argument("--duracion", type=float, default=None, help="Modo soak: segundos de carga continua")
+    parser.add_argument("--puerto", type=int, default=8599)
+    parser.add_argument("--latencia", type=float, default=0.0, help="Latencia simulada por llamada upstream (s)")
+    parser.add_argument("--espera", type=float, default=0.0, help="Pausa entre reruns de una sesión (s)")
+    parser.add_argument("--timeout", type=float, default=120, help="Tiempo máximo por página (s)")
+    parser.add_argument("--intervalo-muestreo", type=float, default=1.0, help="Muestreo de CPU/RSS (s)")
+    parser.add_argument("--fraccion-multitemporal", type=float, default=0.25,
+                        help="Fracción de sesiones con el análisis técnico multitemporal activado")
+    parser.add_argument("--tickers", nargs="*", default=None,
+                        help="Tickers a repartir entre sesiones (por defecto, todas las acciones de la app)")
+    parser.add_argument("--salida", default=None, help="Guardar el informe completo en JSON")
+    args = parser.parse_args()
+
+    informe = ejecutar_prueba_carga(
+        sesiones=args.sesiones,
+        iteraciones=args.iteraciones,
+        duracion=args.duracion,
+        puerto=args.puerto,
+        latencia=args.latencia,
+        espera=args.espera,
+        timeout=args.timeout,
+        intervalo_muestreo=args.intervalo_muestreo,
+        fraccion_multitemporal=args.fraccion_multitemporal,
+        tickers=args.tickers
+    )
+    imprimir_informe(informe)
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as f:
+            json.dump(informe, f, indent=2, ensure_ascii=False)
+        print(f"✅ Informe guardado en {args.salida}")
+
+
+if __name__ == "__main__":
+    main()
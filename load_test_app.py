@@ -0,0 +1,11 @@
+"""
+Punto de entrada de Streamlit para load_test.py: instala los proveedores falsos y ejecuta app.py.
+No usar en producción.
+"""
+import os
+import runpy
+
+import load_test
+
+load_test.instalar_fakes()
+runpy.run_path(os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py"), run_name="__main__")
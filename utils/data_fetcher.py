@@ -35,6 +35,81 @@ def descargar_datos(ticker, periodo="1y", intervalo="1d"):
     except Exception as e:
         return pd.DataFrame()
 
+# Intervalos soportados en modo multitemporal, de menor a mayor, con su regla de pandas.
+# No se incluye "1mo": con los periodos que permite yfinance en intradía nunca llega
+# a las 50 barras que necesita la SMA50 de analizar_tecnico. Tampoco intervalos inferiores
+# a 1h: yfinance solo los sirve para 60 días y remuestrearlos a 1h desde la apertura
+# (p. ej. 9:30) no coincide con las velas horarias del mercado.
+INTERVALOS_MULTITEMPORAL = {
+    "1h": "1h",
+    "1d": "1D",
+    "1wk": "W-FRI"
+}
+
+AGREGACION_OHLCV = {
+    "Open": "first",
+    "High": "max",
+    "Low": "min",
+    "Close": "last",
+    "Adj Close": "last",
+    "Volume": "sum"
+}
+
+# Histórico máximo (en días) que yfinance sirve para intervalos intradía
+LIMITE_DIAS_INTRADIA = {
+    "1h": 730
+}
+
+DIAS_POR_PERIODO = {
+    "1d": 1, "5d": 5, "1mo": 31, "3mo": 92, "6mo": 183, "ytd": 366,
+    "1y": 365, "2y": 730, "5y": 1826, "10y": 3652, "max": float("inf")
+}
+
+def remuestrear_ohlcv(df, intervalo):
+    """
+    Agrega velas OHLCV a un intervalo superior (p. ej. 1h -> 1d -> 1wk) sin nuevas descargas.
+    """
+    if isinstance(df.columns, pd.MultiIndex):
+        df = df.droplevel(1, axis=1)
+    agregacion = {col: func for col, func in AGREGACION_OHLCV.items() if col in df.columns}
+    remuestreado = df.resample(INTERVALOS_MULTITEMPORAL[intervalo]).agg(agregacion)
+    return remuestreado.dropna(subset=["Close"])
+
+def descargar_datos_multitemporal(ticker, intervalos=("1h", "1d", "1wk"), periodo="1y"):
+    """
+    Descarga una única vez el intervalo más fino solicitado y genera el resto por remuestreo local.
+    Devuelve un diccionario {intervalo: DataFrame}; vacío si no hay datos.
+
+    analizar_tecnico necesita al menos 50 barras (SMA50): con periodo="1y" la serie semanal
+    queda en ~52 barras, justo en el límite, y con periodos menores se excluye del score.
+    Lanza ValueError si los intervalos no están soportados o si `periodo` excede el histórico
+    que yfinance sirve para el intervalo base (730 días en 1h).
+    """
+    no_soportados = [i for i in intervalos if i not in INTERVALOS_MULTITEMPORAL]
+    if not intervalos or no_soportados:
+        raise ValueError(
+            f"Intervalos no soportados en modo multitemporal: {no_soportados or 'ninguno indicado'}. "
+            f"Usa alguno de: {', '.join(INTERVALOS_MULTITEMPORAL)}"
+        )
+    orden = list(INTERVALOS_MULTITEMPORAL)
+    intervalos = sorted(set(intervalos), key=orden.index)
+    limite = LIMITE_DIAS_INTRADIA.get(intervalos[0])
+    if limite is not None and DIAS_POR_PERIODO.get(periodo, 0) > limite:
+        raise ValueError(
+            f"yfinance solo sirve {limite} días de histórico en {intervalos[0]}; "
+            f"el periodo '{periodo}' no es válido para el modo multitemporal"
+        )
+    base = descargar_datos(ticker, periodo=periodo, intervalo=intervalos[0])
+    if base.empty:
+        return {}
+    if isinstance(base.columns, pd.MultiIndex):
+        base = base.droplevel(1, axis=1)
+
+    datos = {intervalos[0]: base}
+    for intervalo in intervalos[1:]:
+        datos[intervalo] = remuestrear_ohlcv(base, intervalo)
+    return datos
+
 def get_all_index_tickers():
     # Tickers estándar de Yahoo Finance para índices globales
     return {
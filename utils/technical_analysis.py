@@ -92,3 +92,31 @@ def analizar_tecnico(df):
 
     score = min(100, score)  # límite superior
     return score, justificaciones, df, detalles, tendencias
+
+# Pesos por defecto para combinar los scores de cada temporalidad
+PESOS_MULTITEMPORAL = {
+    "1h": 1,
+    "1d": 2,
+    "1wk": 1
+}
+
+def analizar_tecnico_multitemporal(datos, pesos=None):
+    """
+    Ejecuta analizar_tecnico sobre cada temporalidad de `datos` ({intervalo: DataFrame})
+    y combina los scores en una media ponderada. Las temporalidades sin datos suficientes
+    no cuentan para el score combinado.
+    """
+    pesos = pesos or PESOS_MULTITEMPORAL
+    resultados = {}
+    suma, total_pesos = 0, 0
+
+    for intervalo, df in datos.items():
+        score, justificaciones, df, detalles, tendencias = analizar_tecnico(df)
+        resultados[intervalo] = (score, justificaciones, df, detalles, tendencias)
+        if detalles:
+            peso = pesos.get(intervalo, 1)
+            suma += score * peso
+            total_pesos += peso
+
+    score_combinado = int(suma / total_pesos) if total_pesos else 0
+    return score_combinado, resultados